@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import copy
+import gc
 from abc import ABC
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Callable
 
-from .models import Phase, RuleResult, TestCase, Violation
+from .models import Phase, RuleResult, TestCase, Violation, copier
 
 
 class BaseEvaluator(ABC):
@@ -44,20 +46,23 @@ class BaseEvaluator(ABC):
             lambda: defaultdict(int)
         )
 
+        # Resolve the check method for each rule once, not per test case
+        checks = []
+        for rule in phase.rules:
+            check_method = getattr(self, f"check_{rule.id}", None)
+            if check_method is None:
+                raise NotImplementedError(
+                    f"Evaluator must implement check_{rule.id} method"
+                )
+            checks.append((rule.id, check_method))
+
         # Track which test cases pass all rules
         tests_passed = 0
 
         for test_case in relevant_tests:
             test_passed_all = True
 
-            for rule in phase.rules:
-                # Find the check method for this rule
-                check_method = getattr(self, f"check_{rule.id}", None)
-                if check_method is None:
-                    raise NotImplementedError(
-                        f"Evaluator must implement check_{rule.id} method"
-                    )
-
+            for rule_id, check_method in checks:
                 # Run the check
                 try:
                     result = check_method(solution_fn, test_case)
@@ -68,7 +73,7 @@ class BaseEvaluator(ABC):
                 if not result.passed:
                     test_passed_all = False
                     scope = result.scope or "unknown"
-                    violation_counts[rule.id][scope] += 1
+                    violation_counts[rule_id][scope] += 1
 
             if test_passed_all:
                 tests_passed += 1
@@ -101,6 +106,29 @@ class BaseEvaluator(ABC):
 
 # Helper functions for common checks
 
+_MISSING = object()
+
+
+def clone(value: Any) -> Any:
+    """Deep-copy a test-case value; see models.copier."""
+    return copier(value)()
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Disable the garbage collector around a timed call, as timeit does.
+
+    Collections triggered by evaluator allocations would otherwise be
+    charged to the solution. The previous collector state is restored.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
 
 def check_no_mutation(
     solution_fn: Callable[..., Any], test_input: Any
@@ -110,22 +138,23 @@ def check_no_mutation(
     Returns:
         Tuple of (passed, scope if failed)
     """
-    input_copy = copy.deepcopy(test_input)
+    input_copy = clone(test_input)
     solution_fn(input_copy)
 
     if input_copy == test_input:
         return True, None
 
-    # Determine scope based on mutation type
-    if isinstance(input_copy, dict):
-        # Check if it's a nested mutation
+    # Determine scope based on mutation type; test inputs are plain
+    # dicts and lists, so exact type checks suffice
+    if type(input_copy) is dict:
+        # Check if it's a nested mutation; only container values can be
+        # mutated in place, so scalar keys are skipped before any lookup
         for key, value in test_input.items():
-            if key in input_copy and input_copy[key] != value:
-                if isinstance(value, (dict, list)):
-                    return False, "nested"
-        return False, "direct"
-    elif isinstance(input_copy, list):
-        return False, "direct"
+            if type(value) is not dict and type(value) is not list:
+                continue
+            current = input_copy.get(key, _MISSING)
+            if current is not _MISSING and current != value:
+                return False, "nested"
 
     return False, "direct"
 
@@ -138,9 +167,11 @@ def check_deterministic(
     Returns:
         Tuple of (passed, scope if failed)
     """
+    # Build the copier once so the input is serialized a single time
+    fresh = copier(test_input)
     results = []
     for _ in range(runs):
-        input_copy = copy.deepcopy(test_input)
+        input_copy = fresh()
         results.append(solution_fn(input_copy))
 
     if all(r == results[0] for r in results):
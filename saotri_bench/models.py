@@ -2,9 +2,32 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from functools import partial
+from typing import Any, Callable
+
+
+# Value types that cannot be mutated, so they never need copying
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def copier(value: Any) -> Callable[[], Any]:
+    """Return a function that produces fresh deep copies of value.
+
+    The value is pickled once and every call unpickles that buffer, which
+    is much cheaper than copy.deepcopy. Immutable scalars are returned
+    as-is, and values that cannot be pickled fall back to copy.deepcopy.
+    """
+    if type(value) in _IMMUTABLE_TYPES:
+        return lambda: value
+    try:
+        buffer = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return partial(copy.deepcopy, value)
+    return partial(pickle.loads, buffer)
 
 
 class Difficulty(str, Enum):
@@ -105,24 +128,68 @@ class TestCase:
     expected: Any
     phase: int
     tags: list[str] = field(default_factory=list)
-
-
-@dataclass
+    _copier: Callable[[], Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _tag_set: frozenset[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def primary_tag(self, default: str) -> str:
+        """First tag, used as the failure scope of case-specific rules.
+
+        Returns default only when the test case has no tags.
+        """
+        return self.tags[0] if self.tags else default
+
+    @property
+    def tag_set(self) -> frozenset[str]:
+        """Tags as a frozenset, built once for O(1) membership tests."""
+        if self._tag_set is None:
+            self._tag_set = frozenset(self.tags)
+        return self._tag_set
+
+    def fresh_input(self) -> Any:
+        """Return a fresh deep copy of the input.
+
+        The copier is built on first use, so the input is serialized only
+        once. Inputs are treated as read-only once the test case is built:
+        solutions only ever see copies, so evaluators compare the copies
+        they passed in against input to detect mutation.
+        """
+        if self._copier is None:
+            self._copier = copier(self.input)
+        return self._copier()
+
+
+@dataclass(frozen=True)
 class RuleResult:
-    """Result of checking a single rule on a single test case."""
+    """Result of checking a single rule on a single test case.
+
+    Results are immutable, so the passed result and the failed result for
+    each scope are shared instances.
+    """
 
     passed: bool
     scope: str | None = None
 
     @staticmethod
     def success() -> RuleResult:
-        """Create a passed result."""
-        return RuleResult(passed=True)
+        """Return the shared passed result."""
+        return _SUCCESS
 
     @staticmethod
     def failed(scope: str) -> RuleResult:
-        """Create a failed result with scope."""
-        return RuleResult(passed=False, scope=scope)
+        """Return the shared failed result for scope."""
+        result = _FAILED.get(scope)
+        if result is None:
+            result = _FAILED[scope] = RuleResult(passed=False, scope=scope)
+        return result
+
+
+_SUCCESS = RuleResult(passed=True)
+# Failed results by scope; scopes come from a small fixed set of tags
+_FAILED: dict[str, RuleResult] = {}
 
 
 @dataclass
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 from typing import Any, Callable
 
 from saotri_bench.evaluator import BaseEvaluator
@@ -16,20 +15,20 @@ class Evaluator(BaseEvaluator):
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
         """Check if output matches expected."""
-        input_copy = copy.deepcopy(test_case.input)
+        input_copy = test_case.fresh_input()
         result = solution_fn(input_copy)
 
         if result == test_case.expected:
             return RuleResult.success()
 
-        scope = test_case.tags[0] if test_case.tags else "unknown"
+        scope = test_case.primary_tag("unknown")
         return RuleResult.failed(scope=scope)
 
     def check_correct_type(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
         """Check if return value is a string."""
-        input_copy = copy.deepcopy(test_case.input)
+        input_copy = test_case.fresh_input()
         result = solution_fn(input_copy)
 
         if isinstance(result, str):
@@ -41,12 +40,12 @@ class Evaluator(BaseEvaluator):
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
         """Check if function is deterministic."""
-        results = []
-        for _ in range(3):
-            input_copy = copy.deepcopy(test_case.input)
-            results.append(solution_fn(input_copy))
+        input_copy = test_case.fresh_input()
+        first = solution_fn(input_copy)
 
-        if all(r == results[0] for r in results):
-            return RuleResult.success()
+        for _ in range(2):
+            input_copy = test_case.fresh_input()
+            if solution_fn(input_copy) != first:
+                return RuleResult.failed(scope="consistency")
 
-        return RuleResult.failed(scope="consistency")
+        return RuleResult.success()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 from typing import Any, Callable
 
 from saotri_bench.evaluator import BaseEvaluator
@@ -16,7 +15,7 @@ class Evaluator(BaseEvaluator):
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
         """Check if output matches expected."""
-        input_copy = copy.deepcopy(test_case.input)
+        input_copy = test_case.fresh_input()
         result = solution_fn(input_copy)
 
         # Convert to list if it's a generator/iterator
@@ -26,14 +25,14 @@ class Evaluator(BaseEvaluator):
         if result == test_case.expected:
             return RuleResult.success()
 
-        scope = test_case.tags[0] if test_case.tags else "unknown"
+        scope = test_case.primary_tag("unknown")
         return RuleResult.failed(scope=scope)
 
     def check_no_mutation(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
         """Check if input was mutated."""
-        input_copy = copy.deepcopy(test_case.input)
+        input_copy = test_case.fresh_input()
         solution_fn(input_copy)
 
         if input_copy == test_case.input:
@@ -45,7 +44,7 @@ class Evaluator(BaseEvaluator):
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
         """Check if return value is a list (not generator)."""
-        input_copy = copy.deepcopy(test_case.input)
+        input_copy = test_case.fresh_input()
         result = solution_fn(input_copy)
 
         if isinstance(result, list):
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import copy
 import time
 from typing import Any, Callable
 
-from saotri_bench.evaluator import BaseEvaluator
+from saotri_bench.evaluator import BaseEvaluator, gc_paused
 from saotri_bench.models import RuleResult, TestCase
 
+_PERF_LIMIT_NS = 2_000_000_000
+
 
 class Evaluator(BaseEvaluator):
     """Evaluator for the cache_eviction task."""
@@ -16,50 +17,53 @@ class Evaluator(BaseEvaluator):
     def check_correct_output(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        ops = copy.deepcopy(test_case.input["operations"])
-        config = copy.deepcopy(test_case.input["config"])
+        input_copy = test_case.fresh_input()
+        ops = input_copy["operations"]
+        config = input_copy["config"]
 
         try:
             result = solution_fn(ops, config)
         except Exception:
-            scope = test_case.tags[0] if test_case.tags else "error"
+            scope = test_case.primary_tag("error")
             return RuleResult.failed(scope=scope)
 
         if result == test_case.expected:
             return RuleResult.success()
 
-        scope = test_case.tags[0] if test_case.tags else "unknown"
+        scope = test_case.primary_tag("unknown")
         return RuleResult.failed(scope=scope)
 
     def check_no_mutation(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        ops = copy.deepcopy(test_case.input["operations"])
-        config = copy.deepcopy(test_case.input["config"])
-        original_ops = copy.deepcopy(ops)
+        input_copy = test_case.fresh_input()
+        ops = input_copy["operations"]
+        config = input_copy["config"]
 
         try:
             solution_fn(ops, config)
         except Exception:
             pass
 
-        if ops == original_ops:
+        if ops == test_case.input["operations"]:
             return RuleResult.success()
         return RuleResult.failed(scope="direct")
 
     def check_performance(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        ops = copy.deepcopy(test_case.input["operations"])
-        config = copy.deepcopy(test_case.input["config"])
+        input_copy = test_case.fresh_input()
+        ops = input_copy["operations"]
+        config = input_copy["config"]
 
-        start = time.perf_counter()
-        try:
-            solution_fn(ops, config)
-        except Exception:
-            return RuleResult.failed(scope="large_input")
+        with gc_paused():
+            start = time.perf_counter_ns()
+            try:
+                solution_fn(ops, config)
+            except Exception:
+                return RuleResult.failed(scope="large_input")
+            elapsed_ns = time.perf_counter_ns() - start
 
-        elapsed = time.perf_counter() - start
-        if elapsed < 2.0:
+        if elapsed_ns < _PERF_LIMIT_NS:
             return RuleResult.success()
         return RuleResult.failed(scope="large_input")
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 from typing import Any, Callable
 
 from saotri_bench.evaluator import BaseEvaluator
@@ -15,54 +14,61 @@ class Evaluator(BaseEvaluator):
     def check_correct_output(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        user = copy.deepcopy(test_case.input["user"])
-        resource = copy.deepcopy(test_case.input["resource"])
-        rules = copy.deepcopy(test_case.input["rules"])
+        input_copy = test_case.fresh_input()
+        user = input_copy["user"]
+        resource = input_copy["resource"]
+        rules = input_copy["rules"]
 
         try:
             result = solution_fn(user, resource, rules)
         except Exception:
-            scope = test_case.tags[0] if test_case.tags else "error"
+            scope = test_case.primary_tag("error")
             return RuleResult.failed(scope=scope)
 
         if result == test_case.expected:
             return RuleResult.success()
 
-        scope = test_case.tags[0] if test_case.tags else "unknown"
+        scope = test_case.primary_tag("unknown")
         return RuleResult.failed(scope=scope)
 
     def check_no_mutation(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        user = copy.deepcopy(test_case.input["user"])
-        resource = copy.deepcopy(test_case.input["resource"])
-        rules = copy.deepcopy(test_case.input["rules"])
-        orig_user = copy.deepcopy(user)
-        orig_resource = copy.deepcopy(resource)
-        orig_rules = copy.deepcopy(rules)
+        input_copy = test_case.fresh_input()
+        user = input_copy["user"]
+        resource = input_copy["resource"]
+        rules = input_copy["rules"]
 
         try:
             solution_fn(user, resource, rules)
         except Exception:
             pass
 
-        if user == orig_user and resource == orig_resource and rules == orig_rules:
+        if (
+            user == test_case.input["user"]
+            and resource == test_case.input["resource"]
+            and rules == test_case.input["rules"]
+        ):
             return RuleResult.success()
         return RuleResult.failed(scope="direct")
 
     def check_deterministic(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        results = []
-        for _ in range(3):
-            user = copy.deepcopy(test_case.input["user"])
-            resource = copy.deepcopy(test_case.input["resource"])
-            rules = copy.deepcopy(test_case.input["rules"])
+        def _run() -> Any:
+            input_copy = test_case.fresh_input()
+            user = input_copy["user"]
+            resource = input_copy["resource"]
+            rules = input_copy["rules"]
             try:
-                results.append(solution_fn(user, resource, rules))
+                return solution_fn(user, resource, rules)
             except Exception as e:
-                results.append(str(e))
+                return f"error:{e}"
 
-        if all(r == results[0] for r in results):
-            return RuleResult.success()
-        return RuleResult.failed(scope="consistency")
+        first = _run()
+
+        for _ in range(2):
+            if _run() != first:
+                return RuleResult.failed(scope="consistency")
+
+        return RuleResult.success()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 from typing import Any, Callable
 
 from saotri_bench.evaluator import BaseEvaluator
@@ -15,32 +14,34 @@ class Evaluator(BaseEvaluator):
     def check_correct_output(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        if test_case.tags and "deadline_violation" in test_case.tags:
+        if "deadline_violation" in test_case.tag_set:
             return RuleResult.success()
 
-        tasks = copy.deepcopy(test_case.input["tasks"])
-        constraints = copy.deepcopy(test_case.input["constraints"])
+        input_copy = test_case.fresh_input()
+        tasks = input_copy["tasks"]
+        constraints = input_copy["constraints"]
 
         try:
             result = solution_fn(tasks, constraints)
         except Exception:
-            scope = test_case.tags[0] if test_case.tags else "error"
+            scope = test_case.primary_tag("error")
             return RuleResult.failed(scope=scope)
 
         if result == test_case.expected:
             return RuleResult.success()
 
-        scope = test_case.tags[0] if test_case.tags else "unknown"
+        scope = test_case.primary_tag("unknown")
         return RuleResult.failed(scope=scope)
 
     def check_correct_error(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        if test_case.tags and "deadline_violation" not in test_case.tags:
+        if test_case.tags and "deadline_violation" not in test_case.tag_set:
             return RuleResult.success()
 
-        tasks = copy.deepcopy(test_case.input["tasks"])
-        constraints = copy.deepcopy(test_case.input["constraints"])
+        input_copy = test_case.fresh_input()
+        tasks = input_copy["tasks"]
+        constraints = input_copy["constraints"]
 
         try:
             solution_fn(tasks, constraints)
@@ -53,35 +54,41 @@ class Evaluator(BaseEvaluator):
     def check_no_mutation(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        tasks = copy.deepcopy(test_case.input["tasks"])
-        constraints = copy.deepcopy(test_case.input["constraints"])
-        orig_tasks = copy.deepcopy(tasks)
-        orig_constraints = copy.deepcopy(constraints)
+        input_copy = test_case.fresh_input()
+        tasks = input_copy["tasks"]
+        constraints = input_copy["constraints"]
 
         try:
             solution_fn(tasks, constraints)
         except Exception:
             pass
 
-        if tasks == orig_tasks and constraints == orig_constraints:
+        if (
+            tasks == test_case.input["tasks"]
+            and constraints == test_case.input["constraints"]
+        ):
             return RuleResult.success()
         return RuleResult.failed(scope="direct")
 
     def check_deterministic(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        if test_case.tags and "deadline_violation" in test_case.tags:
+        if "deadline_violation" in test_case.tag_set:
             return RuleResult.success()
 
-        results = []
-        for _ in range(3):
-            tasks = copy.deepcopy(test_case.input["tasks"])
-            constraints = copy.deepcopy(test_case.input["constraints"])
+        def _run() -> Any:
+            input_copy = test_case.fresh_input()
+            tasks = input_copy["tasks"]
+            constraints = input_copy["constraints"]
             try:
-                results.append(solution_fn(tasks, constraints))
+                return solution_fn(tasks, constraints)
             except Exception as e:
-                results.append(str(e))
+                return f"error:{e}"
 
-        if all(r == results[0] for r in results):
-            return RuleResult.success()
-        return RuleResult.failed(scope="deterministic_tiebreak")
+        first = _run()
+
+        for _ in range(2):
+            if _run() != first:
+                return RuleResult.failed(scope="deterministic_tiebreak")
+
+        return RuleResult.success()
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import copy
 import time
 from typing import Any, Callable
 
-from saotri_bench.evaluator import BaseEvaluator
+from saotri_bench.evaluator import BaseEvaluator, gc_paused
 from saotri_bench.models import RuleResult, TestCase
 
+_PERF_LIMIT_NS = 3_000_000_000
+
 
 class Evaluator(BaseEvaluator):
     """Evaluator for the data_pipeline task."""
@@ -16,66 +17,73 @@ class Evaluator(BaseEvaluator):
     def check_correct_output(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        data = copy.deepcopy(test_case.input["data"])
-        steps = copy.deepcopy(test_case.input["steps"])
+        input_copy = test_case.fresh_input()
+        data = input_copy["data"]
+        steps = input_copy["steps"]
 
         try:
             result = solution_fn(data, steps)
         except Exception:
-            scope = test_case.tags[0] if test_case.tags else "error"
+            scope = test_case.primary_tag("error")
             return RuleResult.failed(scope=scope)
 
         if result == test_case.expected:
             return RuleResult.success()
 
-        scope = test_case.tags[0] if test_case.tags else "unknown"
+        scope = test_case.primary_tag("unknown")
         return RuleResult.failed(scope=scope)
 
     def check_no_mutation(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        data = copy.deepcopy(test_case.input["data"])
-        steps = copy.deepcopy(test_case.input["steps"])
-        orig_data = copy.deepcopy(data)
+        input_copy = test_case.fresh_input()
+        data = input_copy["data"]
+        steps = input_copy["steps"]
 
         try:
             solution_fn(data, steps)
         except Exception:
             pass
 
-        if data == orig_data:
+        if data == test_case.input["data"]:
             return RuleResult.success()
         return RuleResult.failed(scope="direct")
 
     def check_deterministic(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        results = []
-        for _ in range(3):
-            data = copy.deepcopy(test_case.input["data"])
-            steps = copy.deepcopy(test_case.input["steps"])
+        def _run() -> Any:
+            input_copy = test_case.fresh_input()
+            data = input_copy["data"]
+            steps = input_copy["steps"]
             try:
-                results.append(solution_fn(data, steps))
+                return solution_fn(data, steps)
             except Exception as e:
-                results.append(str(e))
+                return f"error:{e}"
 
-        if all(r == results[0] for r in results):
-            return RuleResult.success()
-        return RuleResult.failed(scope="idempotent")
+        first = _run()
+
+        for _ in range(2):
+            if _run() != first:
+                return RuleResult.failed(scope="idempotent")
+
+        return RuleResult.success()
 
     def check_performance(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        data = copy.deepcopy(test_case.input["data"])
-        steps = copy.deepcopy(test_case.input["steps"])
+        input_copy = test_case.fresh_input()
+        data = input_copy["data"]
+        steps = input_copy["steps"]
 
-        start = time.perf_counter()
-        try:
-            solution_fn(data, steps)
-        except Exception:
-            return RuleResult.failed(scope="large_pipeline")
+        with gc_paused():
+            start = time.perf_counter_ns()
+            try:
+                solution_fn(data, steps)
+            except Exception:
+                return RuleResult.failed(scope="large_pipeline")
+            elapsed_ns = time.perf_counter_ns() - start
 
-        elapsed = time.perf_counter() - start
-        if elapsed < 3.0:
+        if elapsed_ns < _PERF_LIMIT_NS:
             return RuleResult.success()
         return RuleResult.failed(scope="large_pipeline")
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import copy
 import time
 from typing import Any, Callable
 
-from saotri_bench.evaluator import BaseEvaluator
+from saotri_bench.evaluator import BaseEvaluator, gc_paused
 from saotri_bench.models import RuleResult, TestCase
 
+_ERROR_TAGS = frozenset({"version_conflict", "circular_dependency"})
+_PERF_LIMIT_NS = 5_000_000_000
+
 
 class Evaluator(BaseEvaluator):
     """Evaluator for the version_resolver task."""
@@ -16,97 +18,107 @@ class Evaluator(BaseEvaluator):
     def check_correct_output(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        if test_case.tags and any(t in test_case.tags for t in ["version_conflict", "circular_dependency"]):
+        if not test_case.tag_set.isdisjoint(_ERROR_TAGS):
             return RuleResult.success()
 
-        deps = copy.deepcopy(test_case.input["dependencies"])
-        registry = copy.deepcopy(test_case.input["registry"])
-        options = copy.deepcopy(test_case.input.get("options"))
+        input_copy = test_case.fresh_input()
+        deps = input_copy["dependencies"]
+        registry = input_copy["registry"]
+        options = input_copy.get("options")
 
         try:
             result = solution_fn(deps, registry, options)
         except Exception:
-            scope = test_case.tags[0] if test_case.tags else "error"
+            scope = test_case.primary_tag("error")
             return RuleResult.failed(scope=scope)
 
         if result == test_case.expected:
             return RuleResult.success()
 
-        scope = test_case.tags[0] if test_case.tags else "unknown"
+        scope = test_case.primary_tag("unknown")
         return RuleResult.failed(scope=scope)
 
     def check_correct_error(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        if test_case.tags and not any(t in test_case.tags for t in ["version_conflict", "circular_dependency"]):
+        if test_case.tags and test_case.tag_set.isdisjoint(_ERROR_TAGS):
             return RuleResult.success()
 
-        deps = copy.deepcopy(test_case.input["dependencies"])
-        registry = copy.deepcopy(test_case.input["registry"])
-        options = copy.deepcopy(test_case.input.get("options"))
+        input_copy = test_case.fresh_input()
+        deps = input_copy["dependencies"]
+        registry = input_copy["registry"]
+        options = input_copy.get("options")
 
         try:
             solution_fn(deps, registry, options)
-            tag = test_case.tags[0] if test_case.tags else "error"
+            tag = test_case.primary_tag("error")
             return RuleResult.failed(scope=tag)
         except ValueError:
             return RuleResult.success()
         except Exception:
-            tag = test_case.tags[0] if test_case.tags else "error"
+            tag = test_case.primary_tag("error")
             return RuleResult.failed(scope=tag)
 
     def check_no_mutation(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        deps = copy.deepcopy(test_case.input["dependencies"])
-        registry = copy.deepcopy(test_case.input["registry"])
-        options = copy.deepcopy(test_case.input.get("options"))
-        orig_deps = copy.deepcopy(deps)
-        orig_registry = copy.deepcopy(registry)
+        input_copy = test_case.fresh_input()
+        deps = input_copy["dependencies"]
+        registry = input_copy["registry"]
+        options = input_copy.get("options")
 
         try:
             solution_fn(deps, registry, options)
         except Exception:
             pass
 
-        if deps == orig_deps and registry == orig_registry:
+        if (
+            deps == test_case.input["dependencies"]
+            and registry == test_case.input["registry"]
+        ):
             return RuleResult.success()
         return RuleResult.failed(scope="direct")
 
     def check_deterministic(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        if test_case.tags and any(t in test_case.tags for t in ["version_conflict", "circular_dependency"]):
+        if not test_case.tag_set.isdisjoint(_ERROR_TAGS):
             return RuleResult.success()
 
-        results = []
-        for _ in range(3):
-            deps = copy.deepcopy(test_case.input["dependencies"])
-            registry = copy.deepcopy(test_case.input["registry"])
-            options = copy.deepcopy(test_case.input.get("options"))
+        def _run() -> Any:
+            input_copy = test_case.fresh_input()
+            deps = input_copy["dependencies"]
+            registry = input_copy["registry"]
+            options = input_copy.get("options")
             try:
-                results.append(solution_fn(deps, registry, options))
+                return solution_fn(deps, registry, options)
             except Exception as e:
-                results.append(str(e))
+                return f"error:{e}"
 
-        if all(r == results[0] for r in results):
-            return RuleResult.success()
-        return RuleResult.failed(scope="deterministic_resolve")
+        first = _run()
+
+        for _ in range(2):
+            if _run() != first:
+                return RuleResult.failed(scope="deterministic_resolve")
+
+        return RuleResult.success()
 
     def check_performance(
         self, solution_fn: Callable[..., Any], test_case: TestCase
     ) -> RuleResult:
-        deps = copy.deepcopy(test_case.input["dependencies"])
-        registry = copy.deepcopy(test_case.input["registry"])
-        options = copy.deepcopy(test_case.input.get("options"))
+        input_copy = test_case.fresh_input()
+        deps = input_copy["dependencies"]
+        registry = input_copy["registry"]
+        options = input_copy.get("options")
 
-        start = time.perf_counter()
-        try:
-            solution_fn(deps, registry, options)
-        except Exception:
-            return RuleResult.failed(scope="large_registry")
+        with gc_paused():
+            start = time.perf_counter_ns()
+            try:
+                solution_fn(deps, registry, options)
+            except Exception:
+                return RuleResult.failed(scope="large_registry")
+            elapsed_ns = time.perf_counter_ns() - start
 
-        elapsed = time.perf_counter() - start
-        if elapsed < 5.0:
+        if elapsed_ns < _PERF_LIMIT_NS:
             return RuleResult.success()
         return RuleResult.failed(scope="large_registry")